@@ -6,9 +6,12 @@ See README.md for details
 Uses Google Style Python docstrings:
     https://github.com/google/styleguide/blob/gh-pages/pyguide.md#38-comments-and-docstrings
 """
-import json
+import asyncio
+import fastjsonschema
+import inspect
 import jsonschema
 import logging
+import orjson
 
 from typing import Callable, Optional, List, Union
 
@@ -16,6 +19,10 @@ import jsonrpcbase.exceptions as exceptions
 import jsonrpcbase.types as types
 import jsonrpcbase.utils as utils
 
+# The only protocol version this library speaks; a single interned string
+# shared by the request schema and every response we build
+JSONRPC_VERSION = '2.0'
+
 # Reference: https://www.jsonrpc.org/specification
 REQUEST_SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema#",
@@ -26,7 +33,7 @@ REQUEST_SCHEMA = {
     "required": ["jsonrpc", "method"],
     "properties": {
         "jsonrpc": {
-            "const": "2.0"
+            "const": JSONRPC_VERSION
         },
         "method": {
             "type": "string",
@@ -57,6 +64,47 @@ RPC_ERRORS = {
     -32000: 'Server error',
 }
 
+# Prebuilt error objects keyed by code; copied (never shared) into responses
+# since call_py() hands the response dicts to the caller
+ERROR_TEMPLATES = {
+    code: {'code': code, 'message': message} for (code, message) in RPC_ERRORS.items()
+}
+
+# Compiled once at import time so we skip the metaschema check and validator
+# construction that jsonschema.validate() would otherwise redo on every request
+REQUEST_VALIDATOR = jsonschema.Draft7Validator(REQUEST_SCHEMA)
+
+# Keys allowed by REQUEST_SCHEMA (additionalProperties is false)
+_REQUEST_KEYS = frozenset(('jsonrpc', 'method', 'id', 'params'))
+
+
+def _request_shape_ok(req_data) -> bool:
+    """
+    Fast-path equivalent of REQUEST_VALIDATOR built from C-level dict and
+    isinstance checks. It must only accept requests the schema also accepts;
+    anything it rejects is re-checked by the full validator, which either
+    produces a detailed error message or (rarely, e.g. an integral float id)
+    accepts the request after all.
+    """
+    if not isinstance(req_data, dict):
+        return False
+    if req_data.get('jsonrpc') != JSONRPC_VERSION:
+        return False
+    method = req_data.get('method')
+    if not isinstance(method, str) or not method:
+        return False
+    if not all(key in _REQUEST_KEYS for key in req_data):
+        return False
+    if 'id' in req_data:
+        _id = req_data['id']
+        # bool subclasses int but is not a valid id
+        if not isinstance(_id, (str, int)) or isinstance(_id, bool):
+            return False
+    if 'params' in req_data and not isinstance(req_data['params'], (dict, list)):
+        return False
+    return True
+
+
 log = logging.getLogger(__name__)
 
 
@@ -71,8 +119,14 @@ class JSONRPCService(object):
     development: bool
     # Mapping of method name to function handler
     method_data: types.MethodData
+    # Mapping of method name to precompiled params/result validators
+    _method_validators: types.MethodValidators
+    # Cached list of registered method names for "Method not found" responses
+    _available_methods: List[str]
     # Service name, description, version, etc
     info: types.ServiceInfo
+    # Response payload for the built-in rpc.discover method
+    _discover_result: dict
 
     def __init__(self,
                  info: Union[str, dict],
@@ -89,12 +143,27 @@ class JSONRPCService(object):
         """
         # Initialize service schema
         self.schema = utils.load_schema(schema)
+        # Precompile a validator for every method schema so we only pay the
+        # compilation cost once, at startup, rather than on every request
+        self._method_validators = utils.compile_method_validators(self.schema)
         # A mapping of method name to python function and json-schema
-        self.method_data = {
-            'rpc.discover': types.Method(method=self._handle_discover)
-        }
+        self.method_data = {}
+        # Maintained by add() so error responses don't rebuild it per request
+        self._available_methods = []
         self.development = development
         self.info = utils.load_service_info(info)
+        # Precomputed rpc.discover response; its contents are fixed at init
+        # time, so there is no need to rebuild the dict on every call
+        self._discover_result = {
+            'schema': self.schema,
+            'development_mode': self.development,
+            'service_info': self.info,
+        }
+        self.add(self._handle_discover, name='rpc.discover')
+        # Specialize the response builder once for this service's mode, so
+        # the per-request path never re-checks the development flag
+        if development:
+            self._result_response = self._result_response_dev
 
     def add(self, func: Callable, name: Optional[str] = None):
         """
@@ -113,29 +182,47 @@ class JSONRPCService(object):
         if fname in self.method_data:
             msg = f"Duplicate method name for JSON-RPC service: '{fname}'"
             raise exceptions.DuplicateMethodName(msg)
-        self.method_data[fname] = types.Method(method=func)
+        # Resolve the method's validators up front so the dispatch path does
+        # a single method_data lookup per request
+        validators = self._method_validators.get(fname)
+        if validators is None:
+            # Method absent from the service schema; no param restrictions
+            self.method_data[fname] = types.Method(method=func)
+        else:
+            (params_validator, result_validator) = validators
+            self.method_data[fname] = types.Method(
+                method=func,
+                params_validator=params_validator,
+                result_validator=result_validator,
+                params_allowed=params_validator is not None,
+            )
+        self._available_methods.append(fname)
 
-    def call(self, jsondata: str, metadata=None) -> str:
+    def call(self, jsondata: Union[str, bytes], metadata=None) -> Optional[bytes]:
         """
-        Calls jsonrpc service's method and returns its return value in a JSON
-        string or None if there is none.
+        Calls jsonrpc service's method and returns its return value as
+        utf-8 encoded JSON bytes, or None if there is none.
 
         Args:
-           jsondata: JSON-RPC 2.0 request body (raw string)
+           jsondata: JSON-RPC 2.0 request body (raw string or utf-8 bytes)
            metadata: any additional object to pass along to the handler function as the second arg
 
         Returns:
-            The JSON-RPC 2.0 response as a raw JSON string.
+            The JSON-RPC 2.0 response as utf-8 encoded JSON bytes, ready to
+            be written to a socket without re-encoding. Batch responses are
+            serialized as one JSON array in a single pass, never per entry.
             Will not throw an exception.
         """
         try:
-            request_data = json.loads(jsondata)
-        except ValueError as err:
+            request_data = orjson.loads(jsondata)
+        except orjson.JSONDecodeError as err:
             resp = self._err_response(-32700, err_data={'details': str(err)}, always_respond=True)
-            return json.dumps(resp)
+            return orjson.dumps(resp)
         result = self.call_py(request_data, metadata)
-        if result is not None:
-            return json.dumps(result)
+        if result is None:
+            # Notification request(s); nothing to serialize or send back
+            return None
+        return orjson.dumps(result)
 
     def call_py(self, req_data: types.MethodRequest, metadata=None) -> types.MethodResult:
         """
@@ -159,7 +246,57 @@ class JSONRPCService(object):
             return self._call_batch(req_data, metadata)
         return self._call_single(req_data, metadata)
 
-    def _call_single(self, req_data: dict, metadata) -> dict:
+    async def call_async(self, jsondata: Union[str, bytes], metadata=None) -> Optional[bytes]:
+        """
+        Async counterpart of call(). Handlers registered with add() may be
+        coroutine functions; their results are awaited before the response is
+        built, and batch entries run concurrently.
+
+        Args:
+           jsondata: JSON-RPC 2.0 request body (raw string or utf-8 bytes)
+           metadata: any additional object to pass along to the handler function as the second arg
+
+        Returns:
+            The JSON-RPC 2.0 response as utf-8 encoded JSON bytes, ready to
+            be written to a socket without re-encoding.
+            Will not throw an exception.
+        """
+        try:
+            request_data = orjson.loads(jsondata)
+        except orjson.JSONDecodeError as err:
+            resp = self._err_response(-32700, err_data={'details': str(err)}, always_respond=True)
+            return orjson.dumps(resp)
+        result = await self.call_py_async(request_data, metadata)
+        if result is None:
+            # Notification request(s); nothing to serialize or send back
+            return None
+        return orjson.dumps(result)
+
+    async def call_py_async(self,
+                            req_data: types.MethodRequest,
+                            metadata=None) -> types.MethodResult:
+        """
+        Async counterpart of call_py(). Batch requests are dispatched
+        concurrently with asyncio.gather, so I/O-bound coroutine handlers
+        overlap instead of running back to back.
+
+        Args:
+            req_data: JSON-RPC 2.0 request payload as a python object
+            metadata: Any optional additional data to send to the handler function
+
+        Returns:
+            The JSON-RPC 2.0 response as a python object.
+            Returns None if the request is a notification.
+            Will not throw an exception.
+        """
+        if isinstance(req_data, list):
+            if len(req_data) == 0:
+                err_data = {'details': 'Batch request array is empty'}
+                return self._err_response(-32600, err_data=err_data, always_respond=True)
+            return await self._call_batch_async(req_data, metadata)
+        return await self._call_single_async(req_data, metadata)
+
+    def _call_single(self, req_data: dict, metadata) -> Optional[dict]:
         """
         Make a single method call (used in call_py() and _call_batch())
         Args:
@@ -168,88 +305,147 @@ class JSONRPCService(object):
         Returns:
             JSON-RPC 2.0 result data.
         Raises:
-            jsonschema.ValidationError
+            fastjsonschema.JsonSchemaException
             exceptions.InvalidServerErrorCode
         """
-        # Validate the request body using a json-schema
+        (resp, method, params, result_validator) = self._prepare_call(req_data)
+        if method is None:
+            return resp
         try:
-            jsonschema.validate(req_data, REQUEST_SCHEMA)
-        except jsonschema.exceptions.ValidationError as err:
-            log.exception(f'Invalid JSON-RPC request for {req_data}: {err}')
-            data = {
-                'details': err.message,
-            }
-            return self._err_response(-32600, req_data, err_data=data, always_respond=True)
-        # Handle unknown method error
-        if req_data['method'] not in self.method_data:
+            result = method(params, metadata)
+        except Exception as err:
+            return self._method_error_response(req_data, err)
+        return self._result_response(req_data, result, result_validator)
+
+    async def _call_single_async(self, req_data: dict, metadata) -> Optional[dict]:
+        """
+        Async counterpart of _call_single(); awaits the handler's result when
+        the handler is a coroutine function.
+        """
+        (resp, method, params, result_validator) = self._prepare_call(req_data)
+        if method is None:
+            return resp
+        try:
+            result = method(params, metadata)
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as err:
+            return self._method_error_response(req_data, err)
+        return self._result_response(req_data, result, result_validator)
+
+    def _prepare_call(self, req_data: dict) -> tuple:
+        """
+        Validate a single request and resolve its method; shared between the
+        sync and async dispatch paths.
+
+        Returns:
+            A (resp, method, params, result_validator) tuple. When method is
+            None the request cannot be dispatched and resp is the final
+            response: an error response, or None for notifications.
+        """
+        # Validate the request body; the fast shape check handles well-formed
+        # requests, and only rejects fall through to the full json-schema
+        # validator for a detailed error message
+        if not _request_shape_ok(req_data):
+            try:
+                utils.validate(REQUEST_VALIDATOR, req_data)
+            except jsonschema.exceptions.ValidationError as err:
+                # Lazy formatting at debug level; malformed requests are a
+                # client error and can arrive at full request rate
+                log.debug('Invalid JSON-RPC request for %s: %s', req_data, err)
+                data = {
+                    'details': err.message,
+                }
+                resp = self._err_response(-32600, req_data, err_data=data, always_respond=True)
+                return (resp, None, None, None)
+        # Look up the method entry with a single dict probe
+        entry = self.method_data.get(req_data['method'])
+        if entry is None:
             # Missing method
-            meths = list(self.method_data.keys())
-            err_data = {'available_methods': meths}
-            return self._err_response(-32601, req_data, err_data=err_data)
-        method = self.method_data[req_data['method']].method
+            err_data = {'available_methods': self._available_methods}
+            return (self._err_response(-32601, req_data, err_data=err_data), None, None, None)
+        (method, params_validator, result_validator, params_allowed) = entry
         params = req_data.get('params')
-        (params_schema, result_schema) = utils.get_method_schemas(self.schema, req_data['method'])
-        # Validate the parameters with the json-schema, if present
-        if (req_data['method'] in self.schema['definitions']['methods']
-                and params_schema is None
-                and params is not None):
-            # If there is an entry for the method, but no params schema, then params must be absent
-            err_data = {'details': "Parameters not allowed"}
-            return self._err_response(-32602, req_data, err_data)
-        elif params_schema is not None:
-            # Allow referencing of definitions from the service schema
-            params_schema['definitions'] = self.schema['definitions']
+        # Validate the parameters with the precompiled json-schema validator, if present
+        if not params_allowed:
+            # If there is an entry for the method in the service schema, but
+            # no params schema, then params must be absent
+            if params is not None:
+                err_data = {'details': "Parameters not allowed"}
+                return (self._err_response(-32602, req_data, err_data), None, None, None)
+        elif params_validator is not None:
             try:
-                jsonschema.validate(params, params_schema)
-            except jsonschema.exceptions.ValidationError as err:
+                params_validator(params)
+            except fastjsonschema.JsonSchemaException as err:
                 # Invalid params error response
-                err_data = {'details': err.message, 'path': list(err.path)}
-                return self._err_response(-32602, req_data, err_data)
-        try:
-            result = method(params, metadata)
-        except Exception as err:
-            # Exception was raised inside the method.
-            log.exception(f"Method {req_data['method']} threw an exception: {err}")
-            err_data = {'method': req_data['method']}
-            if hasattr(err, 'message'):
-                err_data['details'] = err.message
-            code = -32000  # Server error
-            if hasattr(err, 'jsonrpc_code'):
-                code = err.jsonrpc_code
-                if code > -32000 or code < -32099:
-                    msg = (
-                        f"Invalid server error code '{code}'; "
-                        "must be in the range -32000 to -32099."
-                    )
-                    raise exceptions.InvalidServerErrorCode(msg)
-            return self._err_response(code, req_data, err_data)
-        # Validate the result in development mode, if a result schema was supplied
-        if self.development and result_schema:
-            result_schema['definitions'] = self.schema['definitions']
-            # Raises jsonschema.ValidationError
-            jsonschema.validate(result, result_schema)
-        _id = utils.response_id(req_data)
-        if type(_id) in (str, int):
+                err_data = {'details': err.message, 'path': utils.validation_path(err)}
+                return (self._err_response(-32602, req_data, err_data), None, None, None)
+        return (None, method, params, result_validator)
+
+    def _method_error_response(self, req_data: dict, err: Exception) -> Optional[dict]:
+        """
+        Build the error response for an exception raised inside a method
+        handler; shared between the sync and async dispatch paths.
+        """
+        log.exception("Method %s threw an exception: %s", req_data['method'], err)
+        err_data = {'method': req_data['method']}
+        # getattr with a default is one attribute lookup; hasattr plus a
+        # second access would pay for it twice
+        message = getattr(err, 'message', None)
+        if message is not None:
+            err_data['details'] = message
+        code = getattr(err, 'jsonrpc_code', -32000)  # Default: Server error
+        if code > -32000 or code < -32099:
+            msg = (
+                f"Invalid server error code '{code}'; "
+                "must be in the range -32000 to -32099."
+            )
+            raise exceptions.InvalidServerErrorCode(msg)
+        return self._err_response(code, req_data, err_data)
+
+    def _result_response(self, req_data: dict, result, result_validator) -> Optional[dict]:
+        """
+        Build the success response for a method result; shared between the
+        sync and async dispatch paths. This is the production variant; in
+        development mode __init__ rebinds it to _result_response_dev, so the
+        hot path never branches on the development flag.
+        """
+        # The request schema has already validated that 'id', when present, is
+        # an int or str, so a plain .get() replaces the response_id helper here
+        _id = req_data.get('id')
+        if _id is not None:
             # Return the result in JSON-RPC 2.0 response format
             return {
                 'id': _id,
-                'jsonrpc': '2.0',
+                'jsonrpc': JSONRPC_VERSION,
                 'result': result,
             }
         else:
             # Notification request; no results
             return None
 
+    def _result_response_dev(self, req_data: dict, result, result_validator) -> Optional[dict]:
+        """
+        Development-mode response builder: validates the result against its
+        schema, if one was supplied, before building the response.
+        """
+        if result_validator is not None:
+            # Raises fastjsonschema.JsonSchemaException
+            result_validator(result)
+        return JSONRPCService._result_response(self, req_data, result, result_validator)
+
     def _call_batch(self, req_data: List[dict], metadata) -> Optional[List[dict]]:
         """
         Make many method calls (used in call_py())
         """
-        results = []
-        for req in req_data:
-            resp = self._call_single(req, metadata)
-            # According to the spec, notification requests do not go in the result array
-            if resp is not None:
-                results.append(resp)
+        # Hoist the bound method out of the loop and dispatch every entry in a
+        # single comprehension pass. According to the spec, notification
+        # requests do not go in the result array, hence the None filter.
+        call_single = self._call_single
+        results = [
+            resp for resp in (call_single(req, metadata) for req in req_data)
+            if resp is not None
+        ]
         # Equivalent to something like `return results or None`, but let's be explicit:
         if len(results) == 0:
             # Every request was a notification
@@ -257,6 +453,20 @@ class JSONRPCService(object):
         else:
             return results
 
+    async def _call_batch_async(self, req_data: List[dict], metadata) -> Optional[List[dict]]:
+        """
+        Make many method calls concurrently (used in call_py_async())
+        """
+        resps = await asyncio.gather(
+            *(self._call_single_async(req, metadata) for req in req_data))
+        # According to the spec, notification requests do not go in the result array
+        results = [resp for resp in resps if resp is not None]
+        if len(results) == 0:
+            # Every request was a notification
+            return None
+        else:
+            return results
+
     def _err_response(self,
                       code: int,
                       req_data: Optional[dict] = None,
@@ -287,24 +497,17 @@ class JSONRPCService(object):
         if _id is None and not always_respond:
             # Do not return error responses for notifications
             return None
-        resp = {
-            'jsonrpc': '2.0',
+        error = dict(ERROR_TEMPLATES[code])
+        if err_data:
+            error['data'] = err_data
+        return {
+            'jsonrpc': JSONRPC_VERSION,
             'id': _id,
-            'error': {
-                'code': code,
-                'message': RPC_ERRORS[code],
-            }
+            'error': error,
         }
-        if err_data:
-            resp['error']['data'] = err_data
-        return resp
 
     def _handle_discover(self, params, meta) -> dict:
         """
         Built-in method handler that shows all methods and type schemas for the service in a dict.
         """
-        ret: dict = {}
-        ret['schema'] = self.schema
-        ret['development_mode'] = self.development
-        ret['service_info'] = self.info
-        return ret
+        return self._discover_result
@@ -12,14 +12,26 @@ class ServiceInfo(NamedTuple):
 
 class Method(NamedTuple):
     """
-    Method function handler, and any other metadata we may need in the future
+    Method function handler plus everything the dispatch hot path needs,
+    resolved once at registration time so a request costs a single dict
+    lookup and one tuple unpack.
     """
     method: Callable
+    # Precompiled fastjsonschema validation functions (None if no schema)
+    params_validator: Optional[Callable] = None
+    result_validator: Optional[Callable] = None
+    # False when the method appears in the service schema without a params
+    # schema, in which case params must be absent from the request
+    params_allowed: bool = True
 
 
 # Mapping of method name to a namedtuple of handler function and anything else we need
 MethodData = Dict[str, Method]
 
+# Mapping of method name to a (params_validator, result_validator) pair of
+# precompiled fastjsonschema validation functions; either element may be None
+MethodValidators = Dict[str, tuple]
+
 # RPC ID field
 Identifier = Optional[Union[int, str]]
 # RPC params or result field
@@ -1,3 +1,4 @@
+import fastjsonschema
 import json
 import jsonschema
 import os
@@ -7,6 +8,21 @@ from typing import Optional, Any, List, Union
 
 import jsonrpcbase.exceptions as exceptions
 
+# Schema for the service info object, frozen at import time with its
+# validator compiled once alongside it
+SERVICE_INFO_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["title", "version", "description"],
+    "properties": {
+        "title": {"type": "string"},
+        "version": {"type": "string"},
+        "description": {"type": "string"},
+    }
+}
+SERVICE_INFO_VALIDATOR = jsonschema.Draft7Validator(SERVICE_INFO_SCHEMA)
+
 
 # Type of `obj` should be anything that has the __getitem__ method
 def get_path(obj: Any, path: List[str]) -> Optional[Any]:
@@ -81,17 +97,7 @@ def load_service_info(service_info: Union[dict, str]):
         info = service_info
     if isinstance(service_info, str):
         info = load_yaml_or_json(service_info)
-    jsonschema.validate(info, {
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "type": "object",
-        "additionalProperties": False,
-        "required": ["title", "version", "description"],
-        "properties": {
-            "title": {"type": "string"},
-            "version": {"type": "string"},
-            "description": {"type": "string"},
-        }
-    })
+    validate(SERVICE_INFO_VALIDATOR, info)
     return info
 
 
@@ -110,6 +116,86 @@ def get_method_schemas(schema: dict, method_name: str):
     return (params, result)
 
 
+def validate(validator, instance):
+    """
+    Validate an instance against a precompiled jsonschema validator.
+
+    Raises the same "best match" ValidationError that jsonschema.validate()
+    would raise (validator.validate() raises the first error instead, which
+    produces less helpful messages for keywords like anyOf).
+    """
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+# Compiled validators shared across all services in the process, keyed by the
+# canonical JSON dump of the schema. Services commonly repeat params/result
+# schemas (shared type definitions, multiple service instances), so identical
+# schemas compile once.
+_validator_pool: dict = {}
+
+
+def compiled_validator(schema: dict):
+    """
+    Compile a fastjsonschema validator for a schema, reusing a previously
+    compiled one when an identical schema has been seen before.
+
+    Args:
+        schema: a standalone params or result schema (with any definitions
+            it references already attached)
+    Returns:
+        The compiled validation function.
+    """
+    key = json.dumps(schema, sort_keys=True)
+    validator = _validator_pool.get(key)
+    if validator is None:
+        validator = fastjsonschema.compile(schema)
+        _validator_pool[key] = validator
+    return validator
+
+
+def compile_method_validators(schema: dict):
+    """
+    Precompile validators for the params and result schemas of every method
+    in the service schema. fastjsonschema code-generates a plain Python
+    function per schema at startup, so request-time validation is a single
+    function call with no schema interpretation.
+
+    Args:
+        schema: the full service schema (already loaded via load_schema)
+    Returns:
+        A dict mapping method name to a (params_validator, result_validator)
+        pair of validation functions, where either element may be None if no
+        schema was supplied. Methods absent from the service schema have no
+        entry at all.
+    """
+    validators = {}
+    for method_name in schema['definitions']['methods']:
+        (params_schema, result_schema) = get_method_schemas(schema, method_name)
+        params_validator = None
+        result_validator = None
+        if params_schema is not None:
+            # Allow referencing of definitions from the service schema
+            params_schema['definitions'] = schema['definitions']
+            params_validator = compiled_validator(params_schema)
+        if result_schema is not None:
+            result_schema['definitions'] = schema['definitions']
+            result_validator = compiled_validator(result_schema)
+        validators[method_name] = (params_validator, result_validator)
+    return validators
+
+
+def validation_path(err: fastjsonschema.JsonSchemaException) -> list:
+    """
+    Get the path of the failing element from a fastjsonschema exception.
+    The library prefixes the path with the name of the root variable
+    ("data") and stringifies array indexes, so strip the prefix and restore
+    integer indexes.
+    """
+    return [int(part) if part.isdigit() else part for part in err.path[1:]]
+
+
 def response_id(req_data):
     """
     Get the ID for the response from a JSON-RPC request
@@ -118,7 +204,9 @@ def response_id(req_data):
     _id = None
     if isinstance(req_data, dict):
         _id = req_data.get('id')
-    if type(_id) in (str, int):
+    # isinstance with a class tuple is a single C-level check; exclude bool
+    # explicitly since it subclasses int but is not a valid id
+    if isinstance(_id, (str, int)) and not isinstance(_id, bool):
         return _id
     else:
         return None
@@ -1,6 +1,8 @@
 """
 jsonrpcbase tests
 """
+import asyncio
+import fastjsonschema
 import json
 import jsonrpcbase
 import jsonschema
@@ -69,6 +71,8 @@ def test_multiple_args():
     Test valid jsonrpc multiple argument calls.
     """
     res_str = s.call('{"jsonrpc": "2.0", "method": "subtract", "params": [42, 23], "id": "1"}')
+    # Responses are utf-8 encoded bytes, ready to write to a socket
+    assert isinstance(res_str, bytes)
     result = json.loads(res_str)
     assert result['jsonrpc'] == "2.0"
     assert result['result'] == 19
@@ -167,6 +171,18 @@ def test_notification():
     assert result is None
 
 
+def test_notification_batch_call():
+    """
+    Test that a batch of only notifications produces no response at all from
+    call() (nothing is serialized).
+    """
+    result = s.call(
+        '[{"jsonrpc": "2.0", "method": "noop", "params": [1]},'
+        ' {"jsonrpc": "2.0", "method": "noop", "params": [2]}]'
+    )
+    assert result is None
+
+
 def test_parse_error():
     """
     Test parse error triggering invalid json messages.
@@ -185,7 +201,7 @@ def test_parse_error():
     assert result['jsonrpc'] == "2.0"
     assert result['error']['code'] == -32700
     assert result['error']['data'] == {
-        'details': "Expecting ':' delimiter: line 5 column 31 (char 93)"
+        'details': "unexpected character: line 5 column 31 (char 93)"
     }
     assert result['id'] is None
 
@@ -373,6 +389,21 @@ def test_batch():
             assert result['result'] is None
 
 
+def test_batch_call_serialization():
+    """
+    Test that a batch call through call() produces a single JSON array
+    response in one bytes payload.
+    """
+    res = s.call(
+        '[{"jsonrpc": "2.0", "method": "square", "params": [4], "id": "1"},'
+        ' {"jsonrpc": "2.0", "method": "subtract", "params": [12, 3], "id": "2"}]'
+    )
+    assert isinstance(res, bytes)
+    results = json.loads(res)
+    assert isinstance(results, list)
+    assert len(results) == 2
+
+
 def test_notification_batch():
     """
     Test valid jsonrpc notification only batch calls.
@@ -505,7 +536,7 @@ def test_positional_validation_error():
     assert result['jsonrpc'] == "2.0"
     assert result['error']['code'] == -32602
     assert result['error']['message'] == 'Invalid params'
-    assert result['error']['data']['details'] == "'x' is not of type 'boolean'"
+    assert result['error']['data']['details'] == "data[4] must be boolean"
     assert result['error']['data']['path'] == [4]
     assert result['id'] == "1"
 
@@ -540,7 +571,7 @@ def test_required_keyword_validation_error():
     assert result['jsonrpc'] == "2.0"
     assert result['error']['code'] == -32602
     assert result['error']['message'] == 'Invalid params'
-    assert result['error']['data']['details'] == "'c' is a required property"
+    assert result['error']['data']['details'] == "data must contain ['c'] properties"
     assert result['error']['data']['path'] == []
     assert result['id'] == "1"
 
@@ -549,13 +580,13 @@ def test_result_schema_validation():
     def echo(params, meta):
         return params['x']
     s.add(echo)
-    with pytest.raises(jsonschema.exceptions.ValidationError):
+    with pytest.raises(fastjsonschema.JsonSchemaException):
         result = s.call_py({
             "jsonrpc": "2.0",
             "method": "echo",
             "params": {"x": "hi"}
         })
-        assert result['error']['message'] == "'x' is not of type integer"
+        assert result['error']['message'] == "data must be integer"
 
 
 def test_duplicate_method_name_err():
@@ -650,6 +681,15 @@ def test_invalid_service_info_path():
         jsonrpcbase.JSONRPCService(schema='test/test_schema.yaml', info='xyz.txt')
 
 
+def test_shared_validator_pool():
+    """
+    Test that services built from identical schemas share compiled validators.
+    """
+    s1 = jsonrpcbase.JSONRPCService(info=_SERVICE_INFO_PATH, schema=_SCHEMA_PATH)
+    s2 = jsonrpcbase.JSONRPCService(info=_SERVICE_INFO_PATH, schema=_SCHEMA_PATH)
+    assert s1._method_validators['subtract'][0] is s2._method_validators['subtract'][0]
+
+
 def test_empty_schema():
     """Test initialization of service with no schema"""
     s = jsonrpcbase.JSONRPCService(info=_SERVICE_INFO_PATH)
@@ -657,6 +697,85 @@ def test_empty_schema():
     assert s.schema['definitions'] == {"methods": {"rpc.discover": {}}}
 
 
+def _run(coro):
+    """Run a coroutine to completion on a fresh event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def async_hello(params, meta):
+    return "Hello async!"
+
+
+async def async_broken_func(params, meta):
+    e = TypeError()
+    e.message = 'async whoops'
+    raise e
+
+
+s.add(async_hello)
+s.add(async_broken_func)
+
+
+def test_async_call():
+    """
+    Test a valid jsonrpc call to a coroutine handler through call_async.
+    """
+    res = _run(s.call_async('{"jsonrpc": "2.0", "method": "async_hello", "id": "1"}'))
+    assert isinstance(res, bytes)
+    result = json.loads(res)
+    assert result['jsonrpc'] == "2.0"
+    assert result['result'] == "Hello async!"
+    assert result['id'] == "1"
+
+
+def test_async_call_sync_handler():
+    """
+    Test that plain (non-coroutine) handlers also work through the async path.
+    """
+    result = _run(s.call_py_async({
+        "jsonrpc": "2.0",
+        "method": "subtract",
+        "params": [42, 23],
+        "id": "1"
+    }))
+    assert result['result'] == 19
+
+
+def test_async_batch():
+    """
+    Test a valid jsonrpc batch call through the async path, with a
+    notification mixed in.
+    """
+    results = _run(s.call_py_async([
+        {"jsonrpc": "2.0", "method": "async_hello", "id": "1"},
+        {"jsonrpc": "2.0", "method": "square", "params": [4], "id": "2"},
+        {"jsonrpc": "2.0", "method": "noop", "params": []},
+    ]))
+    assert len(results) == 2
+    for result in results:
+        if result['id'] == "1":
+            assert result['result'] == "Hello async!"
+        if result['id'] == "2":
+            assert result['result'] == 16
+
+
+def test_async_server_error():
+    """
+    Test the server error response when a coroutine handler raises.
+    """
+    result = _run(s.call_py_async({
+        "jsonrpc": "2.0",
+        "method": "async_broken_func",
+        "id": "1"
+    }))
+    assert result['error']['code'] == -32000
+    assert result['error']['data']['details'] == 'async whoops'
+
+
 def test_override_discover_method():
     """Test the error case where the user tries to override rpc.discover."""
     schema = {